@@ -1,17 +1,13 @@
 import os
 import numpy as np
 
-try:
-  import commands
-except:
-  import subprocess as commands
-
+import subprocess
 import tempfile
 from copy import deepcopy
 import itertools
 
 from phoebe.parameters import dataset as _dataset
-from phoebe.parameters import StringParameter, DictParameter, ArrayParameter, ParameterSet
+from phoebe.parameters import StringParameter, DictParameter, ArrayParameter, FloatArrayParameter, ParameterSet
 from phoebe.parameters.parameters import _extract_index_from_string
 from phoebe import dynamics
 from phoebe.backend import universe, etvs, horizon_analytic
@@ -41,6 +37,28 @@ except ImportError:
 else:
     _use_phb1 = True
 
+def _ensure_phb1_configured():
+    """
+    Initialize and configure phoebe legacy.  This only needs to be done once
+    per interpreter (and phb1.configure may otherwise prompt), so subsequent
+    calls do nothing.
+    """
+    global _phb1_config
+    if _phb1_config:
+        return
+
+    phb1.init()
+    try:
+        if hasattr(phb1, 'auto_configure'):
+            # then phb1 is phoebe_legacy
+            phb1.auto_configure()
+        else:
+            # then phb1 is phoebeBackend
+            phb1.configure()
+    except SystemError:
+        raise SystemError("PHOEBE config failed: try creating PHOEBE config file through GUI")
+
+    _phb1_config = True
 
 
 try:
@@ -71,6 +89,21 @@ _backends_that_require_meshing = ['phoebe', 'legacy']
 
 _skip_filter_checks = {'check_default': False, 'check_visible': False}
 
+# output from probing external executables (within run_checks), stored so that
+# we don't need to spawn a new shell for every call to run_compute.  Failed
+# probes are not stored so that installing the executable takes effect.
+_executable_outputs = {}
+
+def _executable_output(cmd):
+    """Return the shell output of `cmd`, cached after the first successful probe."""
+    if cmd in _executable_outputs:
+        return _executable_outputs[cmd]
+
+    out = subprocess.getoutput(cmd)
+    if 'not found' not in out:
+        _executable_outputs[cmd] = out
+    return out
+
 def _simplify_error_message(msg):
     # simplify error messages so values, etc, don't create separate
     # entries in the returned dictionary.
@@ -93,23 +126,33 @@ def _simplify_error_message(msg):
         msg = 'ld_coeffs and ld_func incompatible'
     return msg
 
-def _needs_mesh(b, dataset, kind, component, compute):
+def _needs_mesh(b, dataset, kind, component, compute, compute_kind=None, dataset_compute_ps=None):
     """
+    dataset_compute_ps (the compute options already filtered for dataset and
+    compute), if provided, will be used to look up rv_method instead of
+    filtering the entire bundle.
     """
     # print "*** _needs_mesh", kind
-    compute_kind = b.get_compute(compute).kind
-    if compute_kind not in _backends_that_require_meshing:
-        # then we don't have meshes for this backend, so all should be False
+    if kind not in ['mesh', 'lc', 'rv', 'lp']:
         return False
 
-    if kind not in ['mesh', 'lc', 'rv', 'lp']:
+    if compute_kind is None:
+        compute_kind = b.get_compute(compute).kind
+    if compute_kind not in _backends_that_require_meshing:
+        # then we don't have meshes for this backend, so all should be False
         return False
 
     # if kind == 'lc' and compute_kind=='phoebe' and b.get_value(qualifier='lc_method', compute=compute, dataset=dataset, context='compute')=='analytical':
     #     return False
 
-    if kind == 'rv' and (compute_kind == 'legacy' or b.get_value(qualifier='rv_method', compute=compute, component=component, dataset=dataset, context='compute', **_skip_filter_checks)=='dynamical'):
-        return False
+    if kind == 'rv':
+        if compute_kind == 'legacy':
+            return False
+
+        if dataset_compute_ps is None:
+            dataset_compute_ps = b.filter(context='compute', compute=compute, dataset=dataset, **_skip_filter_checks)
+        if dataset_compute_ps.get_value(qualifier='rv_method', component=component, **_skip_filter_checks)=='dynamical':
+            return False
 
     return True
 
@@ -128,14 +171,14 @@ def _expand_mesh_times(b, dataset_ps, component):
             add_ps_components = add_ps.filter(qualifier=add_timequalifier).components
             # print "*** add_ps_components", add_dataset, add_ps_components
             if len(add_ps.times):
-                add_times = np.array([float(t) for t in add_ps.times])
+                add_times = np.asarray(add_ps.times, dtype=float)
             elif len(add_ps_components):
                 # then we need to concatenate over all components_
                 # (times@rv@primary and times@rv@secondary are not necessarily
                 # identical)
-                add_times = np.unique(np.append(*[add_ps.get_value(qualifier='compute_times', component=c) for c in add_ps_components]))
+                add_times = np.unique(np.concatenate([add_ps.get_value(qualifier='compute_times', component=c) for c in add_ps_components]))
                 if not len(add_times):
-                    add_times = np.unique(np.append(*[add_ps.get_value(qualifier=add_timequalifier, component=c) for c in add_ps_components]))
+                    add_times = np.unique(np.concatenate([add_ps.get_value(qualifier=add_timequalifier, component=c) for c in add_ps_components]))
             else:
                 # then we're adding from some dataset at the system-level (like lcs)
                 # that have component=None
@@ -154,9 +197,10 @@ def _expand_mesh_times(b, dataset_ps, component):
 
     # we're first going to access the compute_times@mesh... this should not have a component tag
     this_times = dataset_ps.get_value(qualifier='compute_times', component=None, unit=u.d)
-    this_times = np.unique(np.append(this_times,
-                                     [get_times(b, include_times_entry) for include_times_entry in dataset_ps.get_value(qualifier='include_times', expand=True)]
-                                     )
+    # np.unique will handle both the union and sorting of all times in one pass
+    this_times = np.unique(np.concatenate([this_times] +
+                                          [get_times(b, include_times_entry) for include_times_entry in dataset_ps.get_value(qualifier='include_times', expand=True)]
+                                          )
                            )
 
     return this_times
@@ -176,21 +220,27 @@ def _extract_from_bundle(b, compute, dataset=None, times=None,
     :parameter b: the :class:`phoebe.frontend.bundle.Bundle`
     :return: times (list of floats or dictionary of lists of floats),
         infos (list of lists of dictionaries),
+        needs_mesh_by_time (boolean array, same shape as times, only if by_time),
         new_syns (ParameterSet containing all new parameters)
     :raises NotImplementedError: if for some reason there is a problem getting
         a unique match to a dataset (shouldn't ever happen unless
         the user overrides a label)
     """
     provided_times = times
-    times = []
+    # if by_time, the times of each info are collected (in the same order as
+    # by_time_infos) and merged into the sorted times/infolists at the end
+    by_time_infos = []
+    by_time_chunks = []
     infolists = []
     needed_syns = []
 
     # The general format of the datastructures used within PHOEBE are as follows:
     # if by_time:
-    # - times (list within _extract_from_bundle_by_time but then casted to np.array)
-    # - infolists (list of <infolist>, same shape and order as times)
+    # - times (sorted np.array of unique times)
+    # - infolists (list of <infolist>, same shape and order as times, times with
+    #   identical infos share the same <infolist> object)
     # - infolist (list of <info>)
+    # - needs_mesh_by_time (boolean array, same shape and order as times)
     # - info (dict containing information for a given dataset-component computation at the given time)
     #
     # else:
@@ -209,11 +259,38 @@ def _extract_from_bundle(b, compute, dataset=None, times=None,
     else:
         datasets = b.filter(dataset=dataset, context='dataset', **_skip_filter_checks).datasets
 
+    # the kind of the compute options is needed by _needs_mesh for every
+    # dataset-component, so we'll only look it up once
+    compute_kind = b.get_compute(compute).kind
+
     for dataset in datasets:
         dataset_ps = b.filter(context='dataset', dataset=dataset, **_skip_filter_checks)
         dataset_compute_ps = b.filter(context='compute', dataset=dataset, compute=compute, **_skip_filter_checks)
         dataset_kind = dataset_ps.kind
         time_qualifier = _timequalifier_by_kind(dataset_kind)
+
+        # the following options only depend on the dataset (not the component),
+        # so we'll access them once here instead of within the component loop
+        fti_oversample = None
+        mesh_times = None
+        if dataset_kind in ['lc'] and \
+                dataset_ps.get_value(qualifier='exptime', **_skip_filter_checks) > 0 and \
+                dataset_compute_ps.get_value(qualifier='fti_method', fti_method=kwargs.get('fti_method', None), **_skip_filter_checks)=='oversample':
+
+            exptime = dataset_ps.get_value(qualifier='exptime', unit=u.d, **_skip_filter_checks)
+            fti_oversample = dataset_compute_ps.get_value(qualifier='fti_oversample', check_visible=False, **kwargs)
+
+        if dataset_kind == 'mesh' and include_mesh:
+            # then we may be requesting passband-dependent columns be
+            # copied to the mesh from other datasets based on the values
+            # of columns@mesh.  Let's store the needed information here,
+            # where mesh_datasets and mesh_kinds correspond to each
+            # other (but mesh_columns does not).
+            mesh_coordinates = dataset_ps.get_value(qualifier='coordinates', expand=True, **_skip_filter_checks)
+            mesh_columns = dataset_ps.get_value(qualifier='columns', expand=True, **_skip_filter_checks)
+            mesh_datasets = list(set([c.split('@')[1] for c in mesh_columns if len(c.split('@'))>1]))
+            mesh_kinds = [b.filter(dataset=ds, context='dataset', **_skip_filter_checks).kind for ds in mesh_datasets]
+
         if dataset_kind in ['lc']:
             # then the Parameters in the model only exist at the system-level
             # and are not tagged by component
@@ -230,21 +307,24 @@ def _extract_from_bundle(b, compute, dataset=None, times=None,
             elif provided_times is not None and not isinstance(provided_times, dict):
                 this_times = provided_times
             elif dataset_kind == 'mesh' and include_mesh:
-                this_times = _expand_mesh_times(b, dataset_ps, component)
+                if mesh_times is None:
+                    # the expanded mesh times do not depend on the component,
+                    # so only build them for the first component of this dataset
+                    mesh_times = _expand_mesh_times(b, dataset_ps, component)
+                this_times = mesh_times
             elif dataset_kind in ['lp']:
                 this_times = np.unique(dataset_ps.get_value(qualifier='compute_times', unit=u.d, **_skip_filter_checks))
                 if not len(this_times):
                     # then we have Parameters tagged by times, this will probably
                     # also apply to spectra.
-                    this_times = [float(t) for t in dataset_ps.times]
+                    this_times = np.asarray(dataset_ps.times, dtype=float)
             else:
-                timequalifier = _timequalifier_by_kind(dataset_kind)
                 timecomponent = component if dataset_kind not in ['mesh', 'lc'] else None
-                # print "*****", dataset_kind, dataset_ps.kinds, timequalifier, timecomponent
+                # print "*****", dataset_kind, dataset_ps.kinds, time_qualifier, timecomponent
                 # NOTE: compute_times is not component-dependent, but times can be (i.e. for RV datasets)
                 this_times = dataset_ps.get_value(qualifier='compute_times', unit=u.d, **_skip_filter_checks)
                 if not len(this_times):
-                    this_times = dataset_ps.get_value(qualifier=timequalifier, component=timecomponent, unit=u.d, **_skip_filter_checks)
+                    this_times = dataset_ps.get_value(qualifier=time_qualifier, component=timecomponent, unit=u.d, **_skip_filter_checks)
 
                 # we may also need to compute at other times if requested by a
                 # mesh with this dataset in datasets@mesh
@@ -255,20 +335,22 @@ def _extract_from_bundle(b, compute, dataset=None, times=None,
                         # mesh_times = _expand_mesh_times(b, mesh_obs_ps, component=None)
                         # this_times = np.unique(np.append(this_times, mesh_times))
 
-            if dataset_kind in ['lc'] and \
-                    b.get_value(qualifier='exptime', dataset=dataset, **_skip_filter_checks) > 0 and \
-                    dataset_compute_ps.get_value(qualifier='fti_method', fti_method=kwargs.get('fti_method', None), **_skip_filter_checks)=='oversample':
-
+            if fti_oversample is not None:
                 # Then we need to override the times retrieved from the dataset
                 # with the oversampled times.  Later we'll do an average over
                 # the exposure.
                 # NOTE: here we assume that the dataset times are at mid-exposure,
                 # if we want to allow more flexibility, we'll need a parameter
                 # that gives this option and different logic for each case.
-                exptime = dataset_ps.get_value(qualifier='exptime', unit=u.d, **_skip_filter_checks)
-                fti_oversample = dataset_compute_ps.get_value(qualifier='fti_oversample', check_visible=False, **kwargs)
                 # NOTE: if changing this, also change in bundle.run_compute
-                this_times = np.array([np.linspace(t-exptime/2., t+exptime/2., fti_oversample) for t in this_times]).flatten()
+                fti_offsets = np.linspace(-exptime/2., exptime/2., fti_oversample)
+                this_times = (np.asarray(this_times, dtype=float)[:, np.newaxis] + fti_offsets[np.newaxis, :]).ravel()
+
+            # phoebe will compute everything sorted - even if the input times array
+            # is out of order, so let's make sure the exposed times array (and
+            # the times in the infos) are in the correct (sorted) order.  np.sort
+            # returns a copy so that any provided times array is not changed in-place.
+            this_times = np.sort(this_times, kind='stable')
 
             if dataset_kind in ['lp']:
                 # for line profiles and spectra, we only need to compute synthetic
@@ -282,29 +364,18 @@ def _extract_from_bundle(b, compute, dataset=None, times=None,
                 info = {'dataset': dataset,
                         'component': component,
                         'kind': dataset_kind,
-                        'needs_mesh': _needs_mesh(b, dataset, dataset_kind, component, compute),
+                        'needs_mesh': _needs_mesh(b, dataset, dataset_kind, component, compute, compute_kind=compute_kind, dataset_compute_ps=dataset_compute_ps),
                         }
 
                 if dataset_kind == 'mesh' and include_mesh:
-                    # then we may be requesting passband-dependent columns be
-                    # copied to the mesh from other datasets based on the values
-                    # of columns@mesh.  Let's store the needed information here,
-                    # where mesh_datasets and mesh_kinds correspond to each
-                    # other (but mesh_columns does not).
-                    info['mesh_coordinates'] = dataset_ps.get_value(qualifier='coordinates', expand=True, **_skip_filter_checks)
-                    info['mesh_columns'] = dataset_ps.get_value(qualifier='columns', expand=True, **_skip_filter_checks)
-                    info['mesh_datasets'] = list(set([c.split('@')[1] for c in info['mesh_columns'] if len(c.split('@'))>1]))
-                    info['mesh_kinds'] = [b.filter(dataset=ds, context='dataset', **_skip_filter_checks).kind for ds in info['mesh_datasets']]
+                    info['mesh_coordinates'] = mesh_coordinates
+                    info['mesh_columns'] = mesh_columns
+                    info['mesh_datasets'] = mesh_datasets
+                    info['mesh_kinds'] = mesh_kinds
 
                 if by_time:
-                    for time_ in this_times:
-                        # TODO: handle some deltatime allowance here?
-                        if time_ in times:
-                            ind = times.index(time_)
-                            infolists[ind].append(info)
-                        else:
-                            times.append(time_)
-                            infolists.append([info])
+                    by_time_infos.append(info)
+                    by_time_chunks.append(np.asarray(this_times, dtype=float))
                 else:
                     # TODO: this doesn't appear to be different than needed_syns,
                     # unless we change the structure to be per-dataset.
@@ -318,14 +389,40 @@ def _extract_from_bundle(b, compute, dataset=None, times=None,
                 needed_syn_info['times'] = this_times
                 needed_syns.append(needed_syn_info)
 
-    if by_time and len(times):
-        ti = list(zip(times, infolists))
-        ti.sort()
-        times, infolists = zip(*ti)
-
     if by_time:
+        # TODO: handle some deltatime allowance here?
+        if len(by_time_chunks):
+            # np.unique returns the sorted times along with the index within
+            # times for each entry in the concatenated chunks
+            times, time_inds = np.unique(np.concatenate(by_time_chunks), return_inverse=True)
+            time_inds = time_inds.ravel()
+        else:
+            times, time_inds = np.array([]), np.array([], dtype=int)
+
+        # mark which infos are needed at which times
+        info_at_time = np.zeros((len(by_time_infos), len(times)), dtype=bool)
+        chunk_start = 0
+        for i, chunk in enumerate(by_time_chunks):
+            info_at_time[i, time_inds[chunk_start:chunk_start+len(chunk)]] = True
+            chunk_start += len(chunk)
+
+        needs_mesh = np.array([info['needs_mesh'] for info in by_time_infos], dtype=bool)
+        needs_mesh_by_time = np.any(info_at_time[needs_mesh], axis=0)
+
+        # many times share the exact same infos (ie all the times of a single
+        # lc), so we'll only build one infolist per unique set of infos and
+        # have those times share the same infolist object.  This keeps the
+        # packet (pickled for MPI) small and allows workers to do any
+        # per-infolist work once per unique infolist.
+        if len(times):
+            unique_info_at_time, infolist_inds = np.unique(info_at_time.T, axis=0, return_inverse=True)
+            unique_infolists = [[info for info, at_time in zip(by_time_infos, this_info_at_time) if at_time] for this_info_at_time in unique_info_at_time]
+            infolists = [unique_infolists[ind] for ind in infolist_inds.ravel()]
+        else:
+            infolists = []
+
         # print "*** _extract_from_bundle return(times, infolists, syns)", times, infolists, needed_syns
-        return np.asarray(times), infolists, _create_syns(b, needed_syns)
+        return times, infolists, needs_mesh_by_time, _create_syns(b, needed_syns)
     else:
         # print "*** _extract_from_bundle return(infolists, syns)", infolists, needed_syns
         return infolists, _create_syns(b, needed_syns)
@@ -342,11 +439,15 @@ def _create_syns(b, needed_syns):
 
     # needs_mesh = {info['dataset']: info['kind'] for info in needed_syns if info['needs_mesh']}
 
+    # look up the function in parameters.dataset once per kind instead of
+    # once per dataset-component
+    syn_funcs = {kind: getattr(_dataset, kind.lower()) for kind in set(needed_syn['kind'] for needed_syn in needed_syns)}
+
     params = []
     for needed_syn in needed_syns:
         # print "*** _create_syns needed_syn", needed_syn
         # used to be {}_syn
-        syn_kind = '{}'.format(needed_syn['kind'])
+        syn_kind = needed_syn['kind']
         # if needed_syn['kind']=='mesh':
             # parameters.dataset.mesh will handle creating the necessary columns
             # needed_syn['dataset_fields'] = needs_mesh
@@ -355,15 +456,11 @@ def _create_syns(b, needed_syns):
             # datasets = b.get_value(qualifier='datasets', dataset=needed_syn['dataset'], context='dataset')
             # needed_syn['datasets'] = {ds: b.filter(datset=ds, context='dataset').kind for ds in datasets}
 
-        # phoebe will compute everything sorted - even if the input times array
-        # is out of order, so let's make sure the exposed times array is in
-        # the correct (sorted) order
+        # NOTE: times are already sorted by _extract_from_bundle
         if 'times' in needed_syn.keys():
-            needed_syn['times'].sort()
-
             needed_syn['empty_arrays_len'] = len(needed_syn['times'])
 
-        these_params, these_constraints = getattr(_dataset, syn_kind.lower())(syn=True, **needed_syn)
+        these_params, these_constraints = syn_funcs[syn_kind](syn=True, **needed_syn)
         # TODO: do we need to handle constraints?
         these_params = these_params.to_list()
         for param in these_params:
@@ -378,13 +475,17 @@ def _create_syns(b, needed_syns):
 
             # context, model, etc will be handle by the bundle once these are returned
 
-        params += these_params
+        params.extend(these_params)
 
     return ParameterSet(params)
 
-def _make_packet(qualifier, value, time, info, **kwargs):
+def _make_packet(qualifier, value, time, info, unit=None, **kwargs):
     """
     where kwargs overrides info
+
+    if unit is provided, value should be a plain float or array in that unit.
+    The unit is then only attached when filling the synthetics, rather than
+    creating a Quantity for every packet.
     """
     packet = {'dataset': kwargs.get('dataset', info['dataset']),
               'component': kwargs.get('component', info['component']),
@@ -394,8 +495,64 @@ def _make_packet(qualifier, value, time, info, **kwargs):
               'time': time
               }
 
+    if unit is not None:
+        packet['unit'] = unit
+
     return packet
 
+def _same_unit(unit1, unit2):
+    """
+    Check whether two units are equal, by first comparing their
+    representation.  Comparing astropy units with == decomposes both units,
+    which is expensive when done for every packet (each of which creates its
+    own unit instance).
+    """
+    if unit1 is unit2:
+        return True
+    if unit1.bases == unit2.bases and unit1.powers == unit2.powers and unit1.scale == unit2.scale:
+        return True
+    return unit1 == unit2
+
+def _get_syn_params(new_syns, qualifier, dataset, component, kind):
+    """
+    Access the Parameter(s) in new_syns that are filled by all packets with the
+    given tags (see _make_packet).
+
+    :parameter new_syns: :class:`phoebe.parameters.parameters.ParameterSet` of
+        synthetics (as returned by _create_syns)
+    :return: tuple of (params_by_time, param, inds_by_time).  params_by_time
+        is a dictionary of the matching Parameters that are tagged by time (ie
+        mesh columns) with their time as the key (or None if there are none).
+        param is the single matching Parameter that is not tagged by time (or
+        None) and inds_by_time (if param is a FloatArrayParameter) is a
+        dictionary with each time as the key and the array of indices in param
+        at that time as the value.  Packets that match neither should be passed
+        to new_syns.set_value directly.
+    :raises ValueError: if more than one Parameter not tagged by time matches
+    """
+    params = new_syns.filter(qualifier=qualifier, dataset=dataset, component=component, kind=kind, **_skip_filter_checks).to_list()
+
+    params_by_time = {param._time: param for param in params if param._time is not None}
+    params_no_time = [param for param in params if param._time is None]
+
+    if len(params_no_time) > 1:
+        raise ValueError("more than 1 result found for qualifier={}, dataset={}, component={}, kind={}".format(qualifier, dataset, component, kind))
+
+    param = params_no_time[0] if len(params_no_time) else None
+    inds_by_time = None
+    if isinstance(param, FloatArrayParameter):
+        times_params = new_syns.filter(qualifier='times', dataset=dataset, component=component, kind=kind, **_skip_filter_checks).to_list()
+        if len(times_params) == 1:
+            # times may include duplicates, so group the indices of each
+            # unique time (in a single pass) rather than searching the full
+            # array of times for every packet
+            unique_times, time_inds = np.unique(times_params[0].get_value(), return_inverse=True)
+            time_inds = time_inds.ravel()
+            inds = np.split(np.argsort(time_inds, kind='stable'), np.cumsum(np.bincount(time_inds, minlength=len(unique_times)))[:-1])
+            inds_by_time = dict(zip(unique_times, inds))
+
+    return params_by_time if len(params_by_time) else None, param, inds_by_time
+
 class BaseBackend(object):
     def __init__(self):
         return
@@ -470,16 +627,55 @@ class BaseBackend(object):
         # TODO: move to BaseBackendByDataset or BaseBackend?
         logger.debug("rank:{}/{} {}._fill_syns".format(mpi.myrank, mpi.nprocs, self.__class__.__name__))
 
+        # the same Parameters are filled by the packets at every time, so
+        # we'll only filter new_syns once per unique set of tags
+        syn_params = {}
+        # values of Parameters that are filled per-index are written into
+        # a copy of the (preallocated) array and set once all packets are
+        # handled, rather than setting the full array for every single index
+        syn_arrays = {}
+
         for packetlists in rpacketlists_per_worker:
             # single worker
             for packetlist in packetlists:
                 # single time/dataset
                 for packet in packetlist:
                     # single parameter
-                    try:
-                        new_syns.set_value(check_visible=False, check_default=False, ignore_readonly=True, **packet)
-                    except Exception as err:
-                        raise ValueError("failed to set value from packet: {}.  Original error: {}".format(packet, str(err)))
+                    key = (packet['qualifier'], packet['dataset'], packet['component'], packet['kind'])
+                    if key not in syn_params:
+                        syn_params[key] = _get_syn_params(new_syns, *key)
+                    params_by_time, param, inds_by_time = syn_params[key]
+                    time = packet['time']
+                    value = packet['value']
+                    unit = packet.get('unit', None)
+
+                    if params_by_time is not None and time in params_by_time:
+                        params_by_time[time].set_value(value, unit=unit, ignore_readonly=True)
+                    elif param is not None and time is None:
+                        param.set_value(value, unit=unit, ignore_readonly=True)
+                    elif param is not None and inds_by_time is not None:
+                        if key not in syn_arrays:
+                            array_unit = unit if unit is not None else param.default_unit
+                            syn_arrays[key] = (np.array(param.get_value(unit=array_unit), dtype=float), array_unit)
+                        array, array_unit = syn_arrays[key]
+                        if isinstance(value, u.Quantity):
+                            value = value.to(array_unit).value
+                        elif unit is not None and not _same_unit(unit, array_unit):
+                            value = (value*unit).to(array_unit).value
+                        if time in inds_by_time:
+                            array[inds_by_time[time]] = value
+                    else:
+                        # no cached match, so fallback on filtering new_syns
+                        packet = packet.copy()
+                        if packet.pop('unit', None) is not None:
+                            packet['value'] = value*unit
+                        try:
+                            new_syns.set_value(check_visible=False, check_default=False, ignore_readonly=True, **packet)
+                        except Exception as err:
+                            raise ValueError("failed to set value from packet: {}.  Original error: {}".format(packet, str(err)))
+
+        for key, (array, array_unit) in syn_arrays.items():
+            syn_params[key][1].set_value(array, unit=array_unit, ignore_readonly=True)
 
         return new_syns
 
@@ -540,16 +736,17 @@ class BaseBackendByTime(BaseBackend):
         # if the input for times is an empty list, we'll obey dataset times
         # otherwise all datasets will be overridden with the times provided
         # see documentation in _extract_from_bundle for details on the output variables.
-        times, infolists, new_syns = _extract_from_bundle(b, compute=compute,
-                                                          dataset=dataset,
-                                                          times=times,
-                                                          by_time=True,
-                                                          **kwargs)
+        times, infolists, needs_mesh_by_time, new_syns = _extract_from_bundle(b, compute=compute,
+                                                                              dataset=dataset,
+                                                                              times=times,
+                                                                              by_time=True,
+                                                                              **kwargs)
 
         # prepare the packet to be sent to the workers.
         # this packet will be sent to _run_worker as **packet
         packet = {'times': times,
-                  'infolists': infolists}
+                  'infolists': infolists,
+                  'needs_mesh_by_time': needs_mesh_by_time}
 
         return packet, new_syns
 
@@ -559,21 +756,26 @@ class BaseBackendByTime(BaseBackend):
 
         worker_setup_kwargs = self._worker_setup(b, compute, times, infolists, **kwargs)
 
-        inds = range(len(times))
+        inds = np.arange(len(times))
 
         if mpi.enabled:
-            # np.array_split(any_input_array, mpi.nprocs)[mpi.myrank]
-            inds = np.array_split(inds, mpi.nprocs)[mpi.myrank]
-            times = np.array_split(times, mpi.nprocs)[mpi.myrank]
-            infolists = np.array_split(infolists, mpi.nprocs)[mpi.myrank]
+            # NOTE: we only split the indices, times and infolists are then
+            # accessed by index (infolists is a ragged list of lists and
+            # should not be cast to an array)
+            # NOTE: the indices are interleaved between processors (rather than
+            # split into contiguous blocks) since the expensive times (those
+            # that need meshes) tend to be clustered in time and would otherwise
+            # all land on the same processor.  The packets are filled by time,
+            # so the order in which they are returned does not matter.
+            inds = inds[mpi.myrank::mpi.nprocs]
 
         packetlists = [] # entry per-time
-        for i, time, infolist in _progressbar(zip(inds, times, infolists), total=len(times), show_progressbar=not b._within_solver and kwargs.get('progressbar', False)):
+        for i in _progressbar(inds, total=len(inds), show_progressbar=not b._within_solver and kwargs.get('progressbar', False)):
             if kwargs.get('out_fname', False) and os.path.isfile(kwargs.get('out_fname')+'.kill'):
                 logger.warning("received kill signal, exiting sampler loop")
                 break
 
-            packetlist = self._run_single_time(b, i, time, infolist, **worker_setup_kwargs)
+            packetlist = self._run_single_time(b, i, times[i], infolists[i], **worker_setup_kwargs)
             packetlists.append(packetlist)
 
         logger.debug("rank:{}/{} _run_chunk returning packetlist".format(mpi.myrank, mpi.nprocs))
@@ -609,8 +811,11 @@ class BaseBackendByDataset(BaseBackend):
         worker_setup_kwargs = self._worker_setup(b, compute, infolist, **kwargs)
 
         if mpi.enabled:
-            # np.array_split(any_input_array, mpi.nprocs)[mpi.myrank]
-            infolist = np.array_split(infolist, mpi.nprocs)[mpi.myrank]
+            # NOTE: slicing the list directly (as in BaseBackendByTime._run_chunk)
+            # avoids casting the list of info dictionaries to an object array.
+            # Datasets are interleaved between processors and the packets are
+            # filled by dataset, so the order they are returned does not matter.
+            infolist = infolist[mpi.myrank::mpi.nprocs]
 
         packetlists = [] # entry per-dataset
         for info in _progressbar(infolist, total=len(infolist), show_progressbar=not b._within_solver and kwargs.get('progressbar', False)):
@@ -923,8 +1128,10 @@ class PhoebeBackend(BaseBackendByTime):
         starrefs  = hier.get_stars()
         meshablerefs = hier.get_meshables()
 
-        if len(starrefs)==1 and computeparams.get_value(qualifier='distortion_method', component=starrefs[0], **kwargs) in ['roche', 'none']:
-            raise ValueError("distortion_method='{}' not valid for single star".format(computeparams.get_value(qualifier='distortion_method', component=starrefs[0], **kwargs)))
+        if len(starrefs)==1:
+            distortion_method = computeparams.get_value(qualifier='distortion_method', component=starrefs[0], **kwargs)
+            if distortion_method in ['roche', 'none']:
+                raise ValueError("distortion_method='{}' not valid for single star".format(distortion_method))
 
     def _compute_intrinsic_system_at_t0(self, b, compute,
                                           dynamics_method=None,
@@ -1013,13 +1220,18 @@ class PhoebeBackend(BaseBackendByTime):
 
         # b.compute_ld_coeffs(set_value=True) # TODO: only need if irradiation is enabled and only for bolometric
 
-        system = kwargs.get('system', universe.System.from_bundle(b, compute, datasets=b.datasets, **kwargs))
+        system = kwargs.get('system', None)
+        if system is None:
+            system = universe.System.from_bundle(b, compute, datasets=b.datasets, **kwargs)
         # pblums_scale computed within run_compute and then passed as kwarg to run (so should be in kwargs sent to each worker)
         pblums_scale = kwargs.get('pblums_scale')
         for dataset in list(pblums_scale.keys()):
             for comp, pblum_scale in pblums_scale[dataset].items():
                 system.get_body(comp).set_pblum_scale(dataset, component=comp, pblum_scale=pblum_scale)
 
+        # instantaneous distances and syncpars are only provided by the nbody integrators
+        inst_ds, inst_Fs = None, None
+
         if len(meshablerefs) > 1 or hier.get_kind_of(meshablerefs[0])=='envelope':
             logger.debug("rank:{}/{} PhoebeBackend._worker_setup: computing dynamics at all times".format(mpi.myrank, mpi.nprocs))
             if dynamics_method in ['nbody', 'rebound']:
@@ -1056,14 +1268,88 @@ class PhoebeBackend(BaseBackendByTime):
             for i,t in enumerate(times):
                 zs[0][i] = vgamma*(t-t0)
 
+        # stack the dynamics of all bodies into a single (9, nbodies, ntimes)
+        # array so that _run_single_time can access the positions, velocities,
+        # and euler angles of all bodies at a given time with a single slice
+        dynamics_at_times = np.array([xs, ys, zs, vxs, vys, vzs, ethetas, elongans, eincls], dtype=float)
+
+        # whether any dataset at a given time requires a mesh is determined
+        # while building the infolists (see _extract_from_bundle)
+        needs_mesh_by_time = kwargs.get('needs_mesh_by_time')
+
+        # times with identical infos share the same infolist (see
+        # _extract_from_bundle), so anything derived from the infolists only
+        # needs to be done once per unique infolist
+        unique_infolists = list({id(infolist): infolist for infolist in infolists}.values())
+
+        # the options for line profiles and the offsets for rvs do not depend
+        # on time, so we'll access them once per dataset-component here
+        # instead of within _run_single_time
+        lp_options = {}
+        rv_offsets = {}
+        for infolist in unique_infolists:
+            for info in infolist:
+                if info['kind'] == 'rv' and (info['dataset'], info['component']) not in rv_offsets:
+                    rv_offsets[(info['dataset'], info['component'])] = b.get_value(qualifier='rv_offset',
+                                                                                   component=info['component'],
+                                                                                   dataset=info['dataset'],
+                                                                                   context='dataset',
+                                                                                   unit=u.solRad/u.d,
+                                                                                   **_skip_filter_checks)
+
+                if info['kind'] != 'lp' or (info['dataset'], info['component']) in lp_options:
+                    continue
+
+                lp_ps = b.filter(dataset=info['dataset'], context='dataset', **_skip_filter_checks)
+
+                if info['component'] in starrefs:
+                    lp_components = info['component']
+                elif info['component'] in hier.get_orbits():
+                    lp_components = hier.get_stars_of_children_of(info['component'])
+                else:
+                    raise NotImplementedError
+
+                lp_options[(info['dataset'], info['component'])] = {'components': lp_components,
+                                                                    'profile_func': lp_ps.get_value(qualifier='profile_func', **_skip_filter_checks),
+                                                                    'profile_rest': lp_ps.get_value(qualifier='profile_rest', **_skip_filter_checks),
+                                                                    'profile_sv': lp_ps.get_value(qualifier='profile_sv', **_skip_filter_checks),  # UNITS???
+                                                                    'wavelengths': lp_ps.get_value(qualifier='wavelengths', component=info['component'], unit=u.nm, **_skip_filter_checks)}
+
+        # determine which datasets must be populated at the times of each
+        # infolist.  populate_kinds must be the same length (i.e. not
+        # necessarily a unique set... there may be several lcs and/or several
+        # rvs) as populate_datasets which should be a unique set.
+        populate_by_infolist = {}
+        for infolist in unique_infolists:
+            populate_datasets = []
+            populate_kinds = []
+            for info in infolist:
+                if info['dataset'] not in populate_datasets:
+                    populate_datasets.append(info['dataset'])
+                    populate_kinds.append(info['kind'])
+
+                    if info['kind'] == 'mesh':
+                        # then we also need to populate based on any requested
+                        # passband-dependent columns
+                        for mesh_kind, mesh_dataset in zip(info['mesh_kinds'], info['mesh_datasets']):
+                            if mesh_dataset not in populate_datasets:
+                                populate_datasets.append(mesh_dataset)
+                                populate_kinds.append(mesh_kind)
+
+            populate_by_infolist[id(infolist)] = (populate_kinds, populate_datasets)
+
         return dict(system=system,
                     hier=hier,
                     meshablerefs=meshablerefs,
                     starrefs=starrefs,
+                    star_inds={star: i for i, star in enumerate(starrefs)},
                     dynamics_method=dynamics_method,
-                    ts=ts, xs=xs, ys=ys, zs=zs,
-                    vxs=vxs, vys=vys, vzs=vzs,
-                    ethetas=ethetas, elongans=elongans, eincls=eincls)
+                    needs_mesh_by_time=needs_mesh_by_time,
+                    lp_options=lp_options,
+                    rv_offsets=rv_offsets,
+                    populate_by_infolist=populate_by_infolist,
+                    ts=ts, dynamics_at_times=dynamics_at_times,
+                    inst_ds=inst_ds, inst_Fs=inst_Fs)
 
     def _run_single_time(self, b, i, time, infolist, **kwargs):
         logger.debug("rank:{}/{} PhoebeBackend._run_single_time(i={}, time={}, infolist={}, **kwargs.keys={})".format(mpi.myrank, mpi.nprocs, i, time, infolist, kwargs.keys()))
@@ -1072,26 +1358,24 @@ class PhoebeBackend(BaseBackendByTime):
         system = kwargs.get('system')
         hier = kwargs.get('hier')
         meshablerefs = kwargs.get('meshablerefs')
-        starrefs = kwargs.get('starrefs')
+        star_inds = kwargs.get('star_inds')
         dynamics_method = kwargs.get('dynamics_method')
-        xs = kwargs.get('xs')
-        ys = kwargs.get('ys')
-        zs = kwargs.get('zs')
-        vxs = kwargs.get('vxs')
-        vys = kwargs.get('vys')
-        vzs = kwargs.get('vzs')
-        ethetas = kwargs.get('ethetas')
-        elongans = kwargs.get('elongans')
-        eincls = kwargs.get('eincls')
+        needs_mesh_by_time = kwargs.get('needs_mesh_by_time')
+        lp_options = kwargs.get('lp_options')
+        rv_offsets = kwargs.get('rv_offsets')
+        populate_by_infolist = kwargs.get('populate_by_infolist')
+        dynamics_at_times = kwargs.get('dynamics_at_times')
+        inst_ds = kwargs.get('inst_ds')
+        inst_Fs = kwargs.get('inst_Fs')
 
         # Check to see what we might need to do that requires a mesh
         # TODO: make sure to use the requested distortion_method
 
         # we need to extract positions, velocities, and euler angles of ALL bodies at THIS TIME (i)
         logger.debug("rank:{}/{} PhoebeBackend._run_single_time: extracting dynamics at time={}".format(mpi.myrank, mpi.nprocs, time))
-        xi, yi, zi, vxi, vyi, vzi, ethetai, elongani, eincli = dynamics.dynamics_at_i(xs, ys, zs, vxs, vys, vzs, ethetas, elongans, eincls, i=i)
+        xi, yi, zi, vxi, vyi, vzi, ethetai, elongani, eincli = dynamics_at_times[:, :, i]
 
-        if True in [info['needs_mesh'] for info in infolist]:
+        if needs_mesh_by_time[i]:
 
             if dynamics_method in ['nbody', 'rebound']:
                 di = dynamics.at_i(inst_ds, i)
@@ -1129,24 +1413,9 @@ class PhoebeBackend(BaseBackendByTime):
 
             # Now we can fill the observables per-triangle.  We'll wait to integrate
             # until we're ready to fill the synthetics
-            # First we need to determine which datasets must be populated at this
-            # time.  populate_kinds must be the same length (i.e. not necessarily
-            # a unique set... there may be several lcs and/or several rvs) as
-            # populate_datasets which should be a unique set
-            populate_datasets = []
-            populate_kinds = []
-            for info in infolist:
-                if info['dataset'] not in populate_datasets:
-                    populate_datasets.append(info['dataset'])
-                    populate_kinds.append(info['kind'])
-
-                    if info['kind'] == 'mesh':
-                        # then we also need to populate based on any requested
-                        # passband-dependent columns
-                        for mesh_kind, mesh_dataset in zip(info['mesh_kinds'], info['mesh_datasets']):
-                            if mesh_dataset not in populate_datasets:
-                                populate_datasets.append(mesh_dataset)
-                                populate_kinds.append(mesh_kind)
+            # The datasets that must be populated at this time were determined
+            # per-infolist in _worker_setup
+            populate_kinds, populate_datasets = populate_by_infolist[id(infolist)]
 
             logger.debug("rank:{}/{} PhoebeBackend._run_single_time: calling system.populate_observables at time={}".format(mpi.myrank, mpi.nprocs, time))
             system.populate_observables(time, populate_kinds, populate_datasets)
@@ -1158,43 +1427,21 @@ class PhoebeBackend(BaseBackendByTime):
             packet = dict()
 
             # i, time, info['kind'], info['component'], info['dataset']
-            cind = starrefs.index(info['component']) if info['component'] in starrefs else None
+            cind = star_inds.get(info['component'])
             # ts[i], xs[cind][i], ys[cind][i], zs[cind][i], vxs[cind][i], vys[cind][i], vzs[cind][i]
             kind = info['kind']
 
             # now check the kind to see what we need to fill
             if kind=='lp':
-                profile_func = b.get_value(qualifier='profile_func',
-                                           dataset=info['dataset'],
-                                           context='dataset')
-
-                profile_rest = b.get_value(qualifier='profile_rest',
-                                           dataset=info['dataset'],
-                                           context='dataset')
-
-                profile_sv = b.get_value(qualifier='profile_sv',
-                                         dataset=info['dataset'],
-                                         context='dataset')  # UNITS???
-
-                wavelengths = b.get_value(qualifier='wavelengths',
-                                          component=info['component'],
-                                          dataset=info['dataset'],
-                                          context='dataset',
-                                          unit=u.nm)
-
-                if info['component'] in b.hierarchy.get_stars():
-                    lp_components = info['component']
-                elif info['component'] in b.hierarchy.get_orbits():
-                    lp_components = b.hierarchy.get_stars_of_children_of(info['component'])
-                else:
-                    raise NotImplementedError
+                this_lp_options = lp_options[(info['dataset'], info['component'])]
+                wavelengths = this_lp_options['wavelengths']
 
                 obs = system.observe(info['dataset'],
                                      kind=kind,
-                                     components=lp_components,
-                                     profile_func=profile_func,
-                                     profile_rest=profile_rest,
-                                     profile_sv=profile_sv,
+                                     components=this_lp_options['components'],
+                                     profile_func=this_lp_options['profile_func'],
+                                     profile_rest=this_lp_options['profile_rest'],
+                                     profile_sv=this_lp_options['profile_sv'],
                                      wavelengths=wavelengths)
 
                 # TODO: copy the original for wavelengths just like we do with
@@ -1213,19 +1460,15 @@ class PhoebeBackend(BaseBackendByTime):
                                          kind=kind,
                                          components=info['component'])
 
-                    rv = obs['rv'] + b.get_value(qualifier='rv_offset',
-                                                 component=info['component'],
-                                                 dataset=info['dataset'],
-                                                 context='dataset',
-                                                unit=u.solRad/u.d,
-                                                 **_skip_filter_checks)
+                    rv = obs['rv'] + rv_offsets[(info['dataset'], info['component'])]
                 else:
                     # then rv_method == 'dynamical'
                     rv = -1*vzi[cind]
 
                 packetlist.append(_make_packet('rvs',
-                                              rv*u.solRad/u.d,
-                                              time, info))
+                                              rv,
+                                              time, info,
+                                              unit=u.solRad/u.d))
 
             elif kind=='lc':
                 obs = system.observe(info['dataset'],
@@ -1233,8 +1476,9 @@ class PhoebeBackend(BaseBackendByTime):
                                      components=info['component'])
 
                 packetlist.append(_make_packet('fluxes',
-                                              obs['flux']*u.W/u.m**2,
-                                              time, info))
+                                              obs['flux'],
+                                              time, info,
+                                              unit=u.W/u.m**2))
 
             elif kind=='etv':
 
@@ -1269,28 +1513,34 @@ class PhoebeBackend(BaseBackendByTime):
                 # times array was set when creating the synthetic ParameterSet
 
                 packetlist.append(_make_packet('us',
-                                              xi[cind] * u.solRad,
-                                              time, info))
+                                              xi[cind],
+                                              time, info,
+                                              unit=u.solRad))
 
                 packetlist.append(_make_packet('vs',
-                                              yi[cind] * u.solRad,
-                                              time, info))
+                                              yi[cind],
+                                              time, info,
+                                              unit=u.solRad))
 
                 packetlist.append(_make_packet('ws',
-                                              zi[cind] * u.solRad,
-                                              time, info))
+                                              zi[cind],
+                                              time, info,
+                                              unit=u.solRad))
 
                 packetlist.append(_make_packet('vus',
-                                              vxi[cind] * u.solRad/u.d,
-                                              time, info))
+                                              vxi[cind],
+                                              time, info,
+                                              unit=u.solRad/u.d))
 
                 packetlist.append(_make_packet('vvs',
-                                              vyi[cind] * u.solRad/u.d,
-                                              time, info))
+                                              vyi[cind],
+                                              time, info,
+                                              unit=u.solRad/u.d))
 
                 packetlist.append(_make_packet('vws',
-                                              vzi[cind] * u.solRad/u.d,
-                                              time, info))
+                                              vzi[cind],
+                                              time, info,
+                                              unit=u.solRad/u.d))
 
             elif kind=='mesh':
                 body = system.get_body(info['component'])
@@ -1342,18 +1592,27 @@ class PhoebeBackend(BaseBackendByTime):
                                                   body.mesh.centers[:,2],
                                                   time, info))
 
+                if 'vus' in info['mesh_columns'] or 'vvs' in info['mesh_columns'] or 'vws' in info['mesh_columns']:
+                    # velocities.centers are averaged from the vertices on every
+                    # access (if computing at vertices), so we'll only access
+                    # them once
+                    vcenters = body.mesh.velocities.centers
+
                 if 'vus' in info['mesh_columns']:
                     packetlist.append(_make_packet('vus',
-                                                  body.mesh.velocities.centers[:,0] * u.solRad/u.d,
-                                                  time, info))
+                                                  vcenters[:,0],
+                                                  time, info,
+                                                  unit=u.solRad/u.d))
                 if 'vvs' in info['mesh_columns']:
                     packetlist.append(_make_packet('vvs',
-                                                  body.mesh.velocities.centers[:,1] * u.solRad/u.d,
-                                                  time, info))
+                                                  vcenters[:,1],
+                                                  time, info,
+                                                  unit=u.solRad/u.d))
                 if 'vws' in info['mesh_columns']:
                     packetlist.append(_make_packet('vws',
-                                                  body.mesh.velocities.centers[:,2] * u.solRad/u.d,
-                                                  time, info))
+                                                  vcenters[:,2],
+                                                  time, info,
+                                                  unit=u.solRad/u.d))
 
                 # if 'uvw_normals' in info['mesh_columns']:
                 #     packetlist.append(_make_packet('uvw_normals',
@@ -1389,16 +1648,19 @@ class PhoebeBackend(BaseBackendByTime):
 
                 if 'vxs' in info['mesh_columns']:
                     packetlist.append(_make_packet('vxs',
-                                                  body.mesh.roche_cvelocities[:,0] * u.solRad/u.d,
-                                                  time, info))
+                                                  body.mesh.roche_cvelocities[:,0],
+                                                  time, info,
+                                                  unit=u.solRad/u.d))
                 if 'vys' in info['mesh_columns']:
                     packetlist.append(_make_packet('vys',
-                                                  body.mesh.roche_cvelocities[:,1] * u.solRad/u.d,
-                                                  time, info))
+                                                  body.mesh.roche_cvelocities[:,1],
+                                                  time, info,
+                                                  unit=u.solRad/u.d))
                 if 'vzs' in info['mesh_columns']:
                     packetlist.append(_make_packet('vzs',
-                                                  body.mesh.roche_cvelocities[:,2] * u.solRad/u.d,
-                                                  time, info))
+                                                  body.mesh.roche_cvelocities[:,2],
+                                                  time, info,
+                                                  unit=u.solRad/u.d))
 
                 # if 'xyz_normals' in info['mesh_columns']:
                 #     packetlist.append(_make_packet('xyz_normals',
@@ -1465,10 +1727,12 @@ class PhoebeBackend(BaseBackendByTime):
                                                   body.mesh.visibilities,
                                                   time, info))
                 if 'visible_centroids' in info['mesh_columns']:
-                    vcs = np.sum(body.mesh.vertices_per_triangle*body.mesh.weights[:,:,np.newaxis], axis=1)
-                    for i,vc in enumerate(vcs):
-                        if np.all(vc==np.array([0,0,0])):
-                            vcs[i] = np.full(3, np.nan)
+                    # weighted sum over the vertices (v) of each triangle (t) for
+                    # each coordinate (d) without the (N,3,3) temporary product
+                    vcs = np.einsum('tvd,tv->td', body.mesh.vertices_per_triangle, body.mesh.weights)
+                    # elements with no visible portion have all weights=0, so
+                    # their centroid is undefined
+                    vcs[~vcs.any(axis=1)] = np.nan
 
                     packetlist.append(_make_packet('visible_centroids',
                                                   vcs,
@@ -1515,13 +1779,11 @@ class PhoebeBackend(BaseBackendByTime):
                                 mus = body.mesh.mus
                                 value[mus<0] = np.nan
 
-                            if indep=='rvs':
-                                # rvs use solRad/d internally, but default to km/s in the dataset
-                                value *= u.solRad/u.d
-
+                            # rvs use solRad/d internally, but default to km/s in the dataset
                             packetlist.append(_make_packet(indep,
                                                           value,
                                                           time, info,
+                                                          unit=u.solRad/u.d if indep=='rvs' else None,
                                                           dataset=mesh_dataset,
                                                           component=info['component']))
 
@@ -1561,25 +1823,9 @@ class LegacyBackend(BaseBackendByDataset):
         """
         """
         logger.debug("rank:{}/{} LegacyBackend._worker_setup: creating temporary phoebe file".format(mpi.myrank, mpi.nprocs))
-        global _phb1_config
         # make phoebe 1 file
         # tmp_filename = temp_name = next(tempfile._get_candidate_names())
-        computeparams = b.get_compute(compute, force_ps=True)
- #       print('_phb1_config', _phb1_config)
-        if _phb1_config == False:
-            phb1.init()
-            try:
-                if hasattr(phb1, 'auto_configure'):
-                    # then phb1 is phoebe_legacy
-                    phb1.auto_configure()
-                    _phb1_config = True
-                else:
-                    # then phb1 is phoebeBackend
-                    phb1.configure()
-                    _phb1_config = True
-            except SystemError:
-                raise SystemError("PHOEBE config failed: try creating PHOEBE config file through GUI")
-
+        _ensure_phb1_configured()
 
         computeparams = b.get_compute(compute, force_ps=True)
         legacy_dict = io.pass_to_legacy(b, compute=compute, disable_l3=True, **kwargs)
@@ -1610,29 +1856,30 @@ class LegacyBackend(BaseBackendByDataset):
         """
         logger.debug("rank:{}/{} LegacyBackend._run_single_dataset(info['dataset']={} info['component']={} info.keys={}, **kwargs.keys={})".format(mpi.myrank, mpi.nprocs, info['dataset'], info['component'], info.keys(), kwargs.keys()))
 
-        def mqtf(value, direction=None):
+        def mqtf(value):
             """
             mesh quadrant to full
             """
             # value is a 1-dimensional array, but probably a tuple if directly
-            # from legacy
-            value = np.asarray(value)
+            # from legacy.  Non-vector-components (like teffs/loggs) are
+            # identical in all quadrants
+            return np.tile(np.asarray(value), 4)
 
-            # direction is either 'x', 'y', 'z' or None and gives the component
-            # of the current array.
+        def mqtf_vector(x, y, z):
+            """
+            mesh quadrant to full for all three components of a vector at once
+            """
+            value = np.array([x, y, z])
+            # signs of each component (rows) in each quadrant (columns).
             # Plan for quadrants: no flip, flip y, flip z, flip y&z (must be same
             # order as in potentials.discretize_wd_style so we can compare meshes)
-            if direction=='x':
-                a = [+1,+1,+1,+1]
-            elif direction=='y':
-                a = [+1,-1,+1,-1]
-            elif direction=='z':
-                a = [+1,+1,-1,-1]
-            else:
-                # non-vector-component (like teffs/loggs)
-                a = [1,1,1,1]
+            a = np.array([[+1,+1,+1,+1],
+                          [+1,-1,+1,-1],
+                          [+1,+1,-1,-1]])
 
-            return np.concatenate([a[0]*value, a[1]*value, a[2]*value, a[3]*value])
+            # broadcast to (3, 4, N) and then flatten the quadrants for each
+            # component, giving (3, 4*N)
+            return (a[:, :, np.newaxis]*value[:, np.newaxis, :]).reshape(3, -1)
 
 
         lcinds = kwargs.get('lcinds')
@@ -1706,19 +1953,35 @@ class LegacyBackend(BaseBackendByDataset):
             else:
                 cind = 2
 
-            # first we'll get the geometric/bolometric data
+            # determine the passband-datasets with requested columns (and
+            # the index of their lc within legacy)
+            mesh_lcinds = {}
+            for mesh_kind, mesh_dataset in zip(info['mesh_kinds'], info['mesh_datasets']):
+                # print "*** legacy mesh pb", info['dataset'], mesh_dataset, mesh_kind
+                if mesh_kind == 'lc':
+                    if 'abs_normal_intensities@{}'.format(mesh_dataset) in info['mesh_columns']:
+                        mesh_lcinds[mesh_dataset] = lcinds[mesh_dataset]
+
+                else:
+                    # TODO: once phoebeBackend supports exporting meshes for RVs,
+                    # add an elif (or possibly a separate if since the intensities
+                    # will hopefully still be supported for the rv)
+                    logger.warning("legacy cannot export mesh columns for dataset with kind='{}'".format(mesh_kind))
+
             for time in info['times']:
+                # first we'll get the geometric/bolometric data
                 # TODO: what happens if there are no LCs attached?
                 flux, mesh = phb1.lc((time,), 0, True)
+                # the geometric data is computed with the first lc, so we'll
+                # store the mesh per lc index so that lc is not computed again
+                # if any of its passband-dependent columns are requested
+                meshes_by_lcind = {0: mesh}
 
                 # legacy stores everything in Roche coordinates
-                xs = mqtf(mesh['vcx{}'.format(cind)], 'x')
-                ys = mqtf(mesh['vcy{}'.format(cind)], 'y')
-                zs = mqtf(mesh['vcz{}'.format(cind)], 'z')
-                xyz_elements = np.array([xs, ys, zs]).T   # Nx3
-                nxs = mqtf(mesh['grx{}'.format(cind)], 'x')
-                nys = mqtf(mesh['gry{}'.format(cind)], 'y')
-                nzs = mqtf(mesh['grz{}'.format(cind)], 'z')
+                xyz = mqtf_vector(mesh['vcx{}'.format(cind)], mesh['vcy{}'.format(cind)], mesh['vcz{}'.format(cind)])
+                xs, ys, zs = xyz
+                xyz_elements = xyz.T   # Nx3
+                nxs, nys, nzs = mqtf_vector(mesh['grx{}'.format(cind)], mesh['gry{}'.format(cind)], mesh['grz{}'.format(cind)])
                 # TODO: add velocities once supported by PHOEBE 1
                 # vxs =
                 # vys =
@@ -1765,36 +2028,13 @@ class LegacyBackend(BaseBackendByDataset):
                 #     this_syn.set_value(time=time, qualifier='vws', value=vws)
 
 
-                if 'xs' in info['mesh_columns']:
-                    packetlist.append(_make_packet('xs',
-                                                   xs,
-                                                   time,
-                                                   info))
-                if 'ys' in info['mesh_columns']:
-                    packetlist.append(_make_packet('ys',
-                                                   ys,
-                                                   time,
-                                                   info))
-                if 'zs' in info['mesh_columns']:
-                    packetlist.append(_make_packet('zs',
-                                                   zs,
-                                                   time,
-                                                   info))
-                if 'nxs' in info['mesh_columns']:
-                    packetlist.append(_make_packet('nxs',
-                                                   nxs,
-                                                   time,
-                                                   info))
-                if 'nys' in info['mesh_columns']:
-                    packetlist.append(_make_packet('nys',
-                                                   nys,
-                                                   time,
-                                                   info))
-                if 'nzs' in info['mesh_columns']:
-                    packetlist.append(_make_packet('nzs',
-                                                   nzs,
-                                                   time,
-                                                   info))
+                for qualifier, value in (('xs', xs), ('ys', ys), ('zs', zs),
+                                         ('nxs', nxs), ('nys', nys), ('nzs', nzs)):
+                    if qualifier in info['mesh_columns']:
+                        packetlist.append(_make_packet(qualifier,
+                                                       value,
+                                                       time,
+                                                       info))
 
                 # if 'vxs' in info['mesh_columns']:
                     # this_syn.set_value(time=time, qualifier='vxs', value=vxs)
@@ -1830,26 +2070,16 @@ class LegacyBackend(BaseBackendByDataset):
                                                    time,
                                                    info))
 
-            # now we'll loop over the passband-datasets with requested columns
-            for mesh_kind, mesh_dataset in zip(info['mesh_kinds'], info['mesh_datasets']):
-                # print "*** legacy mesh pb", info['dataset'], mesh_dataset, mesh_kind
-                if mesh_kind == 'lc':
-                    lcind = lcinds[mesh_dataset]
-                    for time in info['times']:
-                        flux, mesh = phb1.lc((time,), lcind, True)
+                # now we'll loop over the passband-datasets with requested columns
+                for mesh_dataset, lcind in mesh_lcinds.items():
+                    if lcind not in meshes_by_lcind:
+                        flux, meshes_by_lcind[lcind] = phb1.lc((time,), lcind, True)
 
-                        if 'abs_normal_intensities@{}'.format(mesh_dataset) in info['mesh_columns']:
-                            packetlist.append(_make_packet('abs_normal_intensities',
-                                                           mqtf(mesh['Inorm{}'.format(cind)])*u.erg*u.s**-1*u.cm**-3,
-                                                           time,
-                                                           info,
-                                                           dataset=mesh_dataset))
-
-                else:
-                    # TODO: once phoebeBackend supports exporting meshes for RVs,
-                    # add an elif (or possibly a separate if since the intensities
-                    # will hopefully still be supported for the rv)
-                    logger.warning("legacy cannot export mesh columns for dataset with kind='{}'".format(mesh_kind))
+                    packetlist.append(_make_packet('abs_normal_intensities',
+                                                   mqtf(meshes_by_lcind[lcind]['Inorm{}'.format(cind)])*u.erg*u.s**-1*u.cm**-3,
+                                                   time,
+                                                   info,
+                                                   dataset=mesh_dataset))
 
         else:
             raise NotImplementedError("dataset '{}' with kind '{}' not supported by legacy backend".format(info['dataset'], info['kind']))
@@ -1868,7 +2098,7 @@ class PhotodynamBackend(BaseBackendByDataset):
     """
     def run_checks(self, b, compute, times=[], **kwargs):
         # check whether photodynam is installed
-        out = commands.getoutput('photodynam')
+        out = _executable_output('photodynam')
         if 'not found' in out:
             raise ImportError('photodynam executable not found.  Install manually and try again.')
 
@@ -1910,98 +2140,109 @@ class PhotodynamBackend(BaseBackendByDataset):
         orbit_error = kwargs.get('orbit_error')
         time0 = kwargs.get('time0')
 
-        # write the input file
-        # TODO: need to use TemporaryFiles to be MPI safe
-        fi = open('_tmp_pd_inp', 'w')
-        fi.write('{} {}\n'.format(len(starrefs), time0))
-        fi.write('{} {}\n'.format(step_size, orbit_error))
-        fi.write('\n')
-        fi.write(' '.join([str(b.get_value(qualifier='mass', component=star,
-                context='component', unit=u.solMass) * c.G.to('AU3 / (Msun d2)').value)
-                for star in starrefs])+'\n') # GM
+        # photodynam reads and writes files, so we'll use unique temporary
+        # filenames so that multiple processors (MPI) or instances don't clash
+        tmpfilenames = {}
+        for key in ['inp', 'rep', 'out']:
+            fd, tmpfilenames[key] = tempfile.mkstemp(prefix='_tmp_pd_{}_'.format(key))
+            os.close(fd)
 
-        fi.write(' '.join([str(b.get_value(qualifier='requiv', component=star,
-                context='component', unit=u.AU))
-                for star in starrefs])+'\n')
+        try:
+            # write the input file
+            with open(tmpfilenames['inp'], 'w') as fi:
+                fi.write('{} {}\n'.format(len(starrefs), time0))
+                fi.write('{} {}\n'.format(step_size, orbit_error))
+                fi.write('\n')
+                fi.write(' '.join([str(b.get_value(qualifier='mass', component=star,
+                        context='component', unit=u.solMass) * c.G.to('AU3 / (Msun d2)').value)
+                        for star in starrefs])+'\n') # GM
+
+                fi.write(' '.join([str(b.get_value(qualifier='requiv', component=star,
+                        context='component', unit=u.AU))
+                        for star in starrefs])+'\n')
 
-        if info['kind'] == 'lc':
-            # TODO: this will make two meshing calls, let's create and extract from the dictionary instead, or use set_value=True
-            pblums = [b.get_value(qualifier='pblum', dataset=info['dataset'], component=starref, unit=u.W, check_visible=False) for starref in starrefs]
+                if info['kind'] == 'lc':
+                    # TODO: this will make two meshing calls, let's create and extract from the dictionary instead, or use set_value=True
+                    pblums = [b.get_value(qualifier='pblum', dataset=info['dataset'], component=starref, unit=u.W, check_visible=False) for starref in starrefs]
 
-            u1s, u2s = [], []
-            for star in starrefs:
-                if b.get_value(qualifier='ld_func', component=star, dataset=info['dataset'], context='dataset') == 'quadratic':
-                    ld_coeffs = b.get_value(qualifier='ld_coeffs', component=star, dataset=info['dataset'], context='dataset', check_visible=False)
-                else:
-                    # TODO: can we still interpolate for quadratic manually using b.compute_ld_coeffs?
-                    ld_coeffs = (0,0)
-                    logger.warning("ld_func for {} {} must be 'quadratic' for the photodynam backend, but is not: defaulting to quadratic with coeffs of {}".format(star, info['dataset'], ld_coeffs))
+                    # filter for the dataset once instead of searching the entire
+                    # bundle for ld_func and ld_coeffs of each star
+                    dataset_ps = b.filter(dataset=info['dataset'], context='dataset', **_skip_filter_checks)
 
-                u1s.append(str(ld_coeffs[0]))
-                u2s.append(str(ld_coeffs[1]))
+                    u1s, u2s = [], []
+                    for star in starrefs:
+                        if dataset_ps.get_value(qualifier='ld_func', component=star, **_skip_filter_checks) == 'quadratic':
+                            ld_coeffs = dataset_ps.get_value(qualifier='ld_coeffs', component=star, **_skip_filter_checks)
+                        else:
+                            # TODO: can we still interpolate for quadratic manually using b.compute_ld_coeffs?
+                            ld_coeffs = (0,0)
+                            logger.warning("ld_func for {} {} must be 'quadratic' for the photodynam backend, but is not: defaulting to quadratic with coeffs of {}".format(star, info['dataset'], ld_coeffs))
 
-        else:
-            # we only care about the dynamics, so let's just pass dummy values
-            pblums = [1 for star in starrefs]
-            u1s = ['0' for star in starrefs]
-            u2s = ['0' for star in starrefs]
-
-        if -1 in pblums:
-            raise ValueError('pblums must be set in order to run photodynam')
-
-        fi.write(' '.join([str(pbl / (4*np.pi)) for pbl in pblums])+'\n')
-
-        fi.write(' '.join(u1s)+'\n')
-        fi.write(' '.join(u2s)+'\n')
-
-        fi.write('\n')
-
-        for orbitref in orbitrefs:
-            a = b.get_value(qualifier='sma', component=orbitref,
-                context='component', unit=u.AU)
-            e = b.get_value(qualifier='ecc', component=orbitref,
-                context='component')
-            i = b.get_value(qualifier='incl', component=orbitref,
-                context='component', unit=u.rad)
-            o = b.get_value(qualifier='per0', component=orbitref,
-                context='component', unit=u.rad)
-            l = b.get_value(qualifier='long_an', component=orbitref,
-                context='component', unit=u.rad)
-
-            # t0 = b.get_value(qualifier='t0_perpass', component=orbitref,
-                # context='component', unit=u.d)
-            # period = b.get_value(qualifier='period', component=orbitref,
-                # context='component', unit=u.d)
-
-            # om = 2 * np.pi * (time0 - t0) / period
-            om = b.get_value(qualifier='mean_anom', component=orbitref,
-                             context='component', unit=u.rad)
-
-            fi.write('{} {} {} {} {} {}\n'.format(a, e, i, o, l, om))
-        fi.close()
+                        u1s.append(str(ld_coeffs[0]))
+                        u2s.append(str(ld_coeffs[1]))
 
-        # write the report file
-        fr = open('_tmp_pd_rep', 'w')
-        # t times
-        # F fluxes
-        # x light-time corrected positions
-        # v light-time corrected velocities
-        fr.write('t F x v \n')   # TODO: don't always get all?
-
-        ds = b.get_dataset(dataset=info['dataset'])
-        times = ds.get_value(qualifier='compute_times', unit=u.d)
-        if not len(times) and 'times' in ds.qualifiers:
-            times = b.get_value(qualifier='times', component=info['component'], unit=u.d)
-
-        for t in times:
-            fr.write('{}\n'.format(t))
-        fr.close()
-
-        # run photodynam
-        cmd = 'photodynam _tmp_pd_inp _tmp_pd_rep > _tmp_pd_out'
-        logger.info("running photodynam backend: '{}'".format(cmd))
-        out = commands.getoutput(cmd)
-        stuff = np.loadtxt('_tmp_pd_out', unpack=True)
+                else:
+                    # we only care about the dynamics, so let's just pass dummy values
+                    pblums = [1 for star in starrefs]
+                    u1s = ['0' for star in starrefs]
+                    u2s = ['0' for star in starrefs]
+
+                if -1 in pblums:
+                    raise ValueError('pblums must be set in order to run photodynam')
+
+                fi.write(' '.join([str(pbl / (4*np.pi)) for pbl in pblums])+'\n')
+
+                fi.write(' '.join(u1s)+'\n')
+                fi.write(' '.join(u2s)+'\n')
+
+                fi.write('\n')
+
+                for orbitref in orbitrefs:
+                    a = b.get_value(qualifier='sma', component=orbitref,
+                        context='component', unit=u.AU)
+                    e = b.get_value(qualifier='ecc', component=orbitref,
+                        context='component')
+                    i = b.get_value(qualifier='incl', component=orbitref,
+                        context='component', unit=u.rad)
+                    o = b.get_value(qualifier='per0', component=orbitref,
+                        context='component', unit=u.rad)
+                    l = b.get_value(qualifier='long_an', component=orbitref,
+                        context='component', unit=u.rad)
+
+                    # t0 = b.get_value(qualifier='t0_perpass', component=orbitref,
+                        # context='component', unit=u.d)
+                    # period = b.get_value(qualifier='period', component=orbitref,
+                        # context='component', unit=u.d)
+
+                    # om = 2 * np.pi * (time0 - t0) / period
+                    om = b.get_value(qualifier='mean_anom', component=orbitref,
+                                     context='component', unit=u.rad)
+
+                    fi.write('{} {} {} {} {} {}\n'.format(a, e, i, o, l, om))
+
+            ds = b.get_dataset(dataset=info['dataset'])
+            times = ds.get_value(qualifier='compute_times', unit=u.d)
+            if not len(times) and 'times' in ds.qualifiers:
+                times = b.get_value(qualifier='times', component=info['component'], unit=u.d)
+
+            # write the report file
+            with open(tmpfilenames['rep'], 'w') as fr:
+                # t times
+                # F fluxes
+                # x light-time corrected positions
+                # v light-time corrected velocities
+                fr.write('t F x v \n')   # TODO: don't always get all?
+                for t in times:
+                    fr.write('{}\n'.format(t))
+
+            # run photodynam
+            cmd = 'photodynam {} {} > {}'.format(tmpfilenames['inp'], tmpfilenames['rep'], tmpfilenames['out'])
+            logger.info("running photodynam backend: '{}'".format(cmd))
+            out = subprocess.getoutput(cmd)
+            stuff = np.loadtxt(tmpfilenames['out'], unpack=True)
+        finally:
+            for tmpfilename in tmpfilenames.values():
+                os.remove(tmpfilename)
 
         # parse output to fill packets
         packetlist = []
@@ -2095,7 +2336,7 @@ class JktebopBackend(BaseBackendByDataset):
     """
     def run_checks(self, b, compute, times=[], **kwargs):
         # check whether jktebop is installed
-        out = commands.getoutput('jktebop')
+        out = _executable_output('jktebop')
         if 'not found' in out:
             raise ImportError('jktebop executable not found.  Install manually and try again.')
         version = out.split('JKTEBOP  ')[1].split(' ')[0]
@@ -2372,7 +2613,7 @@ class JktebopBackend(BaseBackendByDataset):
             raise NotImplementedError()
 
         # run jktebop
-        out = commands.getoutput("jktebop {} > {}".format(tmpfilenamein, tmpfilenameout))
+        out = subprocess.getoutput("jktebop {} > {}".format(tmpfilenamein, tmpfilenameout))
 
 
 
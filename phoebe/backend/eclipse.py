@@ -47,8 +47,7 @@ def wd_horizon(meshes, xs, ys, zs, expose_horizon=False):
 
 
     # polar coordinates need to be wrt the center of the ECLIPSING body
-    rhos = [np.sqrt((mesh.centers[:,0]-xs[i_front])**2 +
-                    (mesh.centers[:,1]-ys[i_front])**2) for mesh in (mesh_front, mesh_back)]
+    rhos = [np.hypot(mesh.centers[:,0]-xs[i_front], mesh.centers[:,1]-ys[i_front]) for mesh in (mesh_front, mesh_back)]
     # thetas = [np.arcsin((mesh['center'][:,1]-ys[i_front])/rho) for mesh,rho in zip((mesh_front, mesh_back), rhos)]
     thetas = [np.arctan2(mesh.centers[:,1]-ys[i_front], mesh.centers[:,0]-xs[i_front]) for mesh in (mesh_front, mesh_back)]
     # mus = [mesh['mu'] for mesh in (mesh_front, mesh_back)]
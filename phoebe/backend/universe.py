@@ -82,7 +82,10 @@ def _value(obj):
     if hasattr(obj, 'value'):
         return obj.value
     elif isinstance(obj, np.ndarray):
-        return np.array([o.value for o in obj])
+        if obj.dtype != object:
+            # then already an array of floats
+            return obj
+        return np.array([_value(o) for o in obj])
     elif hasattr(obj, '__iter__'):
         return [_value(o) for o in obj]
     return obj
@@ -467,6 +470,10 @@ class System(object):
                         possible_eclipse = True
                         break
 
+                if possible_eclipse:
+                    # no need to check any remaining pairs
+                    break
+
         if not possible_eclipse and not expose_horizon and horizon_method=='boolean':
             eclipse_method = 'only_horizon'
 
@@ -3263,7 +3270,7 @@ class Pulsation(Feature):
         if self._teffext:
             return coords_for_computations
 
-        x, y, z, r = coords_for_computations[:,0], coords_for_computations[:,1], coords_for_computations[:,2], np.sqrt((coords_for_computations**2).sum(axis=1))
+        x, y, z, r = coords_for_computations[:,0], coords_for_computations[:,1], coords_for_computations[:,2], np.sqrt(np.einsum('ij,ij->i', coords_for_computations, coords_for_computations))
         theta = np.arccos(z/r)
         phi = np.arctan2(y, x)
 
@@ -3294,7 +3301,7 @@ class Pulsation(Feature):
         # if not self._teffext:
             # return coords_for_observations
 
-        x, y, z, r = coords_for_computations[:,0], coords_for_computations[:,1], coords_for_computations[:,2], np.sqrt((coords_for_computations**2).sum(axis=1))
+        x, y, z, r = coords_for_computations[:,0], coords_for_computations[:,1], coords_for_computations[:,2], np.sqrt(np.einsum('ij,ij->i', coords_for_computations, coords_for_computations))
         theta = np.arccos(z/r)
         phi = np.arctan2(y, x)
 
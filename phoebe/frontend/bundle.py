@@ -10740,7 +10740,11 @@ class Bundle(ParameterSet):
             if not kwargs.get('skip_compute_ld_coeffs', False):
                 self.compute_ld_coeffs(compute=compute, set_value=True, skip_checks=True, **{k:v for k,v in kwargs.items() if k not in ['ret_structured_dicts', 'pblum_mode', 'pblum_method', 'skip_checks']})
             # TODO: make sure this accepts all compute parameter overrides (distortion_method, etc)
-            system = kwargs.get('system', self._compute_intrinsic_system_at_t0(compute=compute, datasets=pblum_datasets, atms=atms, **kwargs))
+            # NOTE: only create the system (and compute the dynamics at t0) if
+            # one was not provided, kwargs.get would evaluate the default either way
+            system = kwargs.get('system', None)
+            if system is None:
+                system = self._compute_intrinsic_system_at_t0(compute=compute, datasets=pblum_datasets, atms=atms, **kwargs)
             logger.debug("computing observables with ignore_effects=True for {}".format(pblum_datasets))
             system.populate_observables(t0, ['lc'], pblum_datasets, ignore_effects=True)
         elif pblum_method == 'stefan-boltzmann':
@@ -12007,7 +12011,6 @@ class Bundle(ParameterSet):
                                 # only dataset that currently supports oversampling,
                                 # but this will need to be generalized if/when
                                 # we expand that support to other dataset kinds
-                                fluxes = np.zeros(times_ds.shape)
 
                                 # the oversampled times and fluxes will be
                                 # sorted according to times this may cause
@@ -12017,13 +12020,13 @@ class Bundle(ParameterSet):
                                 times_oversampled_sorted = ml_params.get_value(qualifier='times', dataset=ds, **_skip_filter_checks)
                                 fluxes_oversampled = ml_params.get_value(qualifier='fluxes', dataset=ds, **_skip_filter_checks)
 
-                                for i,t in enumerate(times_ds):
-                                    # rebuild the unsorted oversampled times - see backends._extract_from_bundle_by_time
-                                    # TODO: try to optimize this by having these indices returned by the backend itself
-                                    times_oversampled_this = np.linspace(t-exptime/2., t+exptime/2., fti_oversample)
-                                    sample_inds = np.searchsorted(times_oversampled_sorted, times_oversampled_this)
+                                # rebuild the unsorted oversampled times (one row per datapoint) - see backends._extract_from_bundle
+                                # TODO: try to optimize this by having these indices returned by the backend itself
+                                fti_offsets = np.linspace(-exptime/2., exptime/2., fti_oversample)
+                                times_oversampled = np.asarray(times_ds, dtype=float)[:, np.newaxis] + fti_offsets[np.newaxis, :]
+                                sample_inds = np.searchsorted(times_oversampled_sorted, times_oversampled)
 
-                                    fluxes[i] = np.mean(fluxes_oversampled[sample_inds])
+                                fluxes = np.mean(fluxes_oversampled[sample_inds], axis=1)
 
                                 ml_params.set_value(qualifier='times', dataset=ds, value=times_ds, ignore_readonly=True, **_skip_filter_checks)
                                 ml_params.set_value(qualifier='fluxes', dataset=ds, value=fluxes, ignore_readonly=True, **_skip_filter_checks)
@@ -60,7 +60,7 @@ def _empty_array(kwargs, qualifier):
     if qualifier in kwargs.keys():
         return kwargs.get(qualifier)
     elif 'empty_arrays_len' in kwargs.keys():
-        return np.empty(kwargs.get('empty_arrays_len'))
+        return np.full(kwargs.get('empty_arrays_len'), np.nan)
     else:
         return []
 
@@ -0,0 +1,71 @@
+"""
+"""
+
+import phoebe
+from phoebe.backend import backends
+import numpy as np
+
+
+def test_by_time(verbose=False):
+    b = phoebe.default_binary()
+    # unsorted and duplicate times
+    b.add_dataset('lc', compute_times=[0.7, 0.1, 0.3, 0.1, 0.5], dataset='lc01')
+    # different times per-component, one of which does not need a mesh
+    b.add_dataset('rv', dataset='rv01')
+    b.set_value('times', component='primary', dataset='rv01', value=[0.6, 0.0, 0.3])
+    b.set_value('times', component='secondary', dataset='rv01', value=[0.05, 0.3, 0.5])
+    b.set_value('rv_method', component='secondary', dataset='rv01', value='dynamical')
+    b.add_dataset('orb', compute_times=[0.5, 0.0], dataset='orb01')
+    b.add_dataset('mesh', compute_times=[0.3, 0.25], columns=['teffs'], dataset='mesh01')
+
+    times, infolists, needs_mesh_by_time, new_syns = backends._extract_from_bundle(b, 'phoebe01', by_time=True)
+
+    # build the expected per-time infolists the way they used to be built:
+    # looping over the times of each (per-dataset) info, which are created in
+    # the same order, and appending the info to the infolist at that time
+    infos, _ = backends._extract_from_bundle(b, 'phoebe01', by_time=False)
+    expected_times, expected_infolists = [], []
+    for info in infos:
+        info_no_times = {k: v for k, v in info.items() if k != 'times'}
+        for time in info['times']:
+            if time in expected_times:
+                expected_infolists[expected_times.index(time)].append(info_no_times)
+            else:
+                expected_times.append(time)
+                expected_infolists.append([info_no_times])
+    expected_times, expected_infolists = zip(*sorted(zip(expected_times, expected_infolists), key=lambda ti: ti[0]))
+
+    # a duplicate time within a dataset used to add the same info twice at that
+    # time (computing it twice), whereas now it is only included once
+    assert len(expected_infolists[expected_times.index(0.1)]) == 2
+    expected_infolists = [[info for i, info in enumerate(infolist) if not any(info is other for other in infolist[:i])] for infolist in expected_infolists]
+    expected_needs_mesh = [np.any([info['needs_mesh'] for info in infolist]) for infolist in expected_infolists]
+
+    if verbose:
+        print("times: {}".format(times))
+        print("needs_mesh_by_time: {}".format(needs_mesh_by_time))
+
+    assert np.all(times == expected_times)
+    assert np.all(times == [0.0, 0.05, 0.1, 0.25, 0.3, 0.5, 0.6, 0.7])
+    assert len(infolists) == len(times)
+    assert infolists == expected_infolists
+    assert np.all(needs_mesh_by_time == expected_needs_mesh)
+    # the secondary rvs and orbits do not need a mesh
+    assert not needs_mesh_by_time[list(times).index(0.05)]
+    assert needs_mesh_by_time[list(times).index(0.25)]
+
+    # times with the same infos share the same infolist object, and each info
+    # is shared between all infolists that include it
+    assert infolists[list(times).index(0.1)] is infolists[list(times).index(0.7)]
+    assert infolists[list(times).index(0.0)] is not infolists[list(times).index(0.6)]
+    lc_infos = [info for infolist in infolists for info in infolist if info['dataset'] == 'lc01']
+    assert all(info is lc_infos[0] for info in lc_infos)
+
+    # the exposed times of the synthetics are sorted but not made unique
+    assert np.all(new_syns.get_value('times', dataset='lc01') == [0.1, 0.1, 0.3, 0.5, 0.7])
+
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    test_by_time(verbose=True)
@@ -0,0 +1,128 @@
+"""
+"""
+
+import phoebe
+from phoebe import u
+from phoebe.backend import backends
+import numpy as np
+import pytest
+
+
+def _bundle_and_syns():
+    b = phoebe.default_binary()
+    b.add_dataset('lc', compute_times=[0.3, 0.1, 0.2], dataset='lc01')
+    b.add_dataset('rv', compute_times=[0.1, 0.2], dataset='rv01')
+    b.add_dataset('mesh', compute_times=[0.25], columns=['teffs', 'volume'], dataset='mesh01')
+
+    times, infolists, needs_mesh_by_time, new_syns = backends._extract_from_bundle(b, 'phoebe01')
+    return b, new_syns
+
+
+def test_mesh_columns_by_time():
+    b, new_syns = _bundle_and_syns()
+    info = {'dataset': 'mesh01', 'component': 'primary', 'kind': 'mesh'}
+
+    packetlist = [backends._make_packet('teffs', np.array([5000., 6000.]), 0.25, info, unit=u.K),
+                  backends._make_packet('volume', 2.0*u.km**3, 0.25, info)]
+    backends.PhoebeBackend()._fill_syns(new_syns, [[packetlist]])
+
+    assert np.all(new_syns.get_value('teffs', dataset='mesh01', component='primary', time=0.25, unit=u.K) == [5000., 6000.])
+    assert abs(new_syns.get_value('volume', dataset='mesh01', component='primary', time=0.25, unit=u.km**3) - 2.0) < 1e-8
+    # the other component was not in the packets and should be left untouched
+    assert new_syns.get_value('volume', dataset='mesh01', component='secondary', time=0.25) == 0.0
+
+
+def test_per_index_units():
+    b, new_syns = _bundle_and_syns()
+    rv_info = {'dataset': 'rv01', 'component': 'primary', 'kind': 'rv'}
+    lc_info = {'dataset': 'lc01', 'component': None, 'kind': 'lc'}
+
+    # one packet per time (and out of order), in units other than the
+    # default units of the synthetics
+    packetlists = [[backends._make_packet('rvs', 2000., 0.2, rv_info, unit=u.m/u.s)],
+                   [backends._make_packet('rvs', 1000., 0.1, rv_info, unit=u.m/u.s),
+                    backends._make_packet('fluxes', 3.0*u.mW/u.m**2, 0.3, lc_info)]]
+    backends.PhoebeBackend()._fill_syns(new_syns, [packetlists])
+
+    rvs = new_syns.get_parameter('rvs', dataset='rv01', component='primary')
+    assert rvs.default_unit == u.km/u.s
+    assert np.allclose(rvs.get_value(unit=u.km/u.s), [1.0, 2.0])
+
+    fluxes = new_syns.get_parameter('fluxes', dataset='lc01')
+    assert fluxes.default_unit == u.W/u.m**2
+    assert np.isclose(fluxes.get_value(unit=u.W/u.m**2)[2], 3e-3)
+
+
+def test_nan_prefill():
+    b, new_syns = _bundle_and_syns()
+    lc_info = {'dataset': 'lc01', 'component': None, 'kind': 'lc'}
+
+    packetlist = [backends._make_packet('fluxes', 1.0, 0.1, lc_info, unit=u.W/u.m**2),
+                  backends._make_packet('fluxes', 3.0, 0.3, lc_info, unit=u.W/u.m**2)]
+    backends.PhoebeBackend()._fill_syns(new_syns, [[packetlist]])
+
+    assert np.all(new_syns.get_value('times', dataset='lc01') == [0.1, 0.2, 0.3])
+    fluxes = new_syns.get_value('fluxes', dataset='lc01')
+    assert fluxes[0] == 1.0 and fluxes[2] == 3.0
+    assert np.isnan(fluxes[1])
+    # synthetics for which no packets were sent at all are entirely nan
+    assert np.all(np.isnan(new_syns.get_value('rvs', dataset='rv01', component='secondary')))
+
+
+def test_duplicate_times():
+    b = phoebe.default_binary()
+    b.add_dataset('lc', compute_times=[0.3, 0.1, 0.2, 0.1], dataset='lc01')
+    times, infolists, needs_mesh_by_time, new_syns = backends._extract_from_bundle(b, 'phoebe01')
+    lc_info = {'dataset': 'lc01', 'component': None, 'kind': 'lc'}
+
+    params_by_time, param, inds_by_time = backends._get_syn_params(new_syns, 'fluxes', 'lc01', None, 'lc')
+    assert params_by_time is None
+    assert np.all(inds_by_time[0.1] == [0, 1])
+    assert np.all(inds_by_time[0.3] == [3])
+
+    packetlist = [backends._make_packet('fluxes', float(time), time, lc_info, unit=u.W/u.m**2) for time in times]
+    backends.PhoebeBackend()._fill_syns(new_syns, [[packetlist]])
+
+    assert np.all(new_syns.get_value('fluxes', dataset='lc01') == [0.1, 0.1, 0.2, 0.3])
+
+
+def test_ambiguous_match():
+    b, new_syns = _bundle_and_syns()
+
+    # component=None matches the rvs of both stars
+    with pytest.raises(ValueError, match='more than 1 result found'):
+        backends._get_syn_params(new_syns, 'rvs', 'rv01', None, 'rv')
+
+    packetlist = [backends._make_packet('rvs', 1.0, 0.1, {'dataset': 'rv01', 'component': None, 'kind': 'rv'})]
+    with pytest.raises(ValueError, match='more than 1 result found'):
+        backends.PhoebeBackend()._fill_syns(new_syns, [[packetlist]])
+
+
+def test_fallback_unit():
+    b, new_syns = _bundle_and_syns()
+    info = {'dataset': 'mesh01', 'component': 'primary', 'kind': 'mesh'}
+
+    # a packet without a time for a column that is tagged by time is neither
+    # in params_by_time nor per-index, so it is passed to new_syns.set_value,
+    # which should still respect the unit of the packet
+    params_by_time, param, inds_by_time = backends._get_syn_params(new_syns, 'volume', 'mesh01', 'primary', 'mesh')
+    assert list(params_by_time.keys()) == [0.25]
+    assert param is None
+
+    packetlist = [backends._make_packet('volume', 2.0, None, info, unit=u.km**3)]
+    backends.PhoebeBackend()._fill_syns(new_syns, [[packetlist]])
+
+    assert abs(new_syns.get_value('volume', dataset='mesh01', component='primary', unit=u.km**3) - 2.0) < 1e-8
+    # the packet should not have been modified by attaching the unit
+    assert packetlist[0]['value'] == 2.0 and packetlist[0]['unit'] == u.km**3
+
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    test_mesh_columns_by_time()
+    test_per_index_units()
+    test_nan_prefill()
+    test_duplicate_times()
+    test_ambiguous_match()
+    test_fallback_unit()